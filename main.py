@@ -1,12 +1,39 @@
-from datetime import datetime, date
+from datetime import datetime
 import json
+import os
+import sys
+import tempfile
+import numpy as np
 from typing import Dict, List, Optional
-import pandas as pd
 from dataclasses import dataclass
-import matplotlib.pyplot as plt
 from pathlib import Path
 import random
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the numpy path
+    njit = None
+
+try:
+    from tax_kernel import tax as _tax_c
+except ImportError:  # the Cython extension is optional; see setup.py
+    _tax_c = None
+
+_MSG_PROFILE_MISSING = "Please set your risk tolerance and investment goals for personalized advice."
+_MSG_SAVINGS_FIRST = "Focus on increasing your savings rate before making significant investments."
+_MSG_HIGH_RATES = "With high interest rates ({:.2f}%), consider bonds or high-yield savings accounts."
+_MSG_TAX_CLOSING = (
+    "Keep all receipts and documentation for your deductions and credits.",
+    "The deadline for filing your tax return is April 15th. Mark your calendar!"
+)
+_MSG_SAVINGS_LOW = "Consider increasing your savings rate to at least 20% of income"
+_MSG_HOUSING_HIGH = "Housing costs exceed 30% of income - consider ways to reduce housing expenses"
+
 @dataclass
 class Transaction:
     date: datetime
@@ -16,30 +43,90 @@ class Transaction:
     transaction_type: str  # 'income' or 'expense'
 
 class BudgetManager:
+    CATEGORIES = tuple(map(sys.intern, (
+        'Housing',
+        'Transportation',
+        'Food',
+        'Utilities',
+        'Healthcare',
+        'Entertainment',
+        'Savings',
+        'Income',
+        'Other',
+        'mortgage_interest',
+        'charitable_contributions',
+        'medical_expenses',
+        'child_care',
+        'education'
+    )))
+    VALID_CATEGORIES: frozenset = frozenset(CATEGORIES)
+    TRANSACTION_TYPES = ('income', 'expense')
+    # Category codes are positions in CATEGORIES; these map sorted names back to codes
+    _SORTED_CODES = np.argsort(np.array(CATEGORIES)).astype(np.int16)
+    _SORTED_CATEGORIES = np.array(CATEGORIES)[_SORTED_CODES]
+
     def __init__(self):
-        self.categories = {
-            'Housing': 0,
-            'Transportation': 0,
-            'Food': 0,
-            'Utilities': 0,
-            'Healthcare': 0,
-            'Entertainment': 0,
-            'Savings': 0,
-            'Income': 0,
-            'Other': 0,
-            'mortgage_interest': 0,
-            'charitable_contributions': 0,
-            'medical_expenses': 0,
-            'child_care': 0,
-            'education': 0
-        }
-        self.transactions: List[Transaction] = []
+        self.categories = dict.fromkeys(self.CATEGORIES, 0.0)
+        self._cat_to_code: Dict[str, int] = {category: code for code, category in enumerate(self.CATEGORIES)}
+        self._code_to_cat: List[str] = list(self.CATEGORIES)
+        self._size = 0
+        self._amount = np.empty(0, dtype=np.float64)
+        self._date = np.empty(0, dtype='datetime64[us]')
+        self._cat_code = np.empty(0, dtype=np.int16)
+        self._is_income = np.empty(0, dtype=np.bool_)
+        self._month_key = np.empty(0, dtype=np.int32)
+        self._descriptions: List[str] = []
+        self._report_cache: Dict[tuple, tuple] = {}
         self.monthly_budget = {}
         self.monthly_spending = {}
 
+    @property
+    def transactions(self) -> List[Transaction]:
+        n = self._size
+        return [
+            Transaction(
+                date=transaction_date,
+                amount=amount,
+                category=self._code_to_cat[code],
+                description=description,
+                transaction_type='income' if is_income else 'expense'
+            )
+            for transaction_date, amount, code, description, is_income in zip(
+                self._date[:n].astype(object), self._amount[:n].tolist(), self._cat_code[:n].tolist(),
+                self._descriptions, self._is_income[:n].tolist()
+            )
+        ]
+
+    def transaction_columns(self) -> Dict[str, list]:
+        n = self._size
+        return {
+            'date': self._date[:n].astype(str).tolist(),
+            'amount': self._amount[:n].tolist(),
+            'category': np.array(self._code_to_cat)[self._cat_code[:n]].tolist(),
+            'description': list(self._descriptions),
+            'transaction_type': np.where(self._is_income[:n], 'income', 'expense').tolist()
+        }
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * self._amount.size, 16)
+        self._amount = np.resize(self._amount, capacity)
+        self._date = np.resize(self._date, capacity)
+        self._cat_code = np.resize(self._cat_code, capacity)
+        self._is_income = np.resize(self._is_income, capacity)
+        self._month_key = np.resize(self._month_key, capacity)
+
+    @staticmethod
+    def _month_keys(dates):
+        # year * 12 + month, taken from the stored datetime64 values
+        return dates.astype('datetime64[M]').astype(np.int32) + (1970 * 12 + 1)
+
+    def _invalidate_reports(self) -> None:
+        self._report_cache.clear()
+
     def set_budget(self, category: str, amount: float) -> None:
-        if category in self.categories:
+        if category in self.VALID_CATEGORIES:
             self.monthly_budget[category] = amount
+            self._invalidate_reports()
         else:
             raise ValueError(f"Invalid category: {category}")
 
@@ -48,54 +135,149 @@ class BudgetManager:
 
     def add_transaction(self, amount: float, category: str, description: str,
                         transaction_type: str = 'expense', transaction_date: Optional[datetime] = None) -> None:
-        if category not in self.categories:
+        if category not in self.VALID_CATEGORIES:
             raise ValueError(f"Invalid category: {category}")
+        if transaction_type not in self.TRANSACTION_TYPES:
+            raise ValueError(f"Invalid transaction type: {transaction_type}")
+        # Use the interned name from the code table; sys.intern rejects str subclasses such as np.str_
+        code = self._cat_to_code[category]
+        category = self._code_to_cat[code]
 
         if transaction_date is None:
             transaction_date = datetime.now()
-
-        transaction = Transaction(
-            date=transaction_date,
-            amount=amount,
-            category=category,
-            description=description,
-            transaction_type=transaction_type
-        )
-        self.transactions.append(transaction)
+        # Keep the wall-clock time; numpy would otherwise shift aware datetimes to UTC
+        if isinstance(transaction_date, datetime):
+            transaction_date = transaction_date.replace(tzinfo=None)
+
+        if self._size == self._amount.size:
+            self._grow(self._size + 1)
+        i = self._size
+        self._amount[i] = amount
+        self._date[i] = transaction_date
+        self._cat_code[i] = code
+        self._is_income[i] = transaction_type == 'income'
+        self._month_key[i] = self._month_keys(self._date[i])
+        self._descriptions.append(description)
+        self._size += 1
+        self._invalidate_reports()
 
         if transaction_type == 'expense':
             self.categories[category] += amount
         else:  # income
             self.categories['Income'] += amount
 
+    def add_transactions_batch(self, amounts, categories, descriptions,
+                               transaction_types=None, transaction_dates=None) -> None:
+        amounts = np.asarray(amounts, dtype=np.float64)
+        categories = np.asarray(categories, dtype=str)
+        descriptions = list(descriptions)
+        count = amounts.size
+        if categories.size != count or len(descriptions) != count:
+            raise ValueError("amounts, categories and descriptions must have the same length")
+
+        valid = np.isin(categories, self._SORTED_CATEGORIES)
+        if not valid.all():
+            raise ValueError(f"Invalid category: {categories[~valid][0]}")
+        codes = self._SORTED_CODES[np.searchsorted(self._SORTED_CATEGORIES, categories)]
+
+        if transaction_types is None:
+            is_income = np.zeros(count, dtype=np.bool_)
+        else:
+            transaction_types = np.asarray(transaction_types, dtype=str)
+            valid = np.isin(transaction_types, self.TRANSACTION_TYPES)
+            if not valid.all():
+                raise ValueError(f"Invalid transaction type: {transaction_types[~valid][0]}")
+            is_income = transaction_types == 'income'
+
+        if transaction_dates is None:
+            dates = np.full(count, np.datetime64(datetime.now(), 'us'))
+        else:
+            dates = np.asarray(transaction_dates)
+            if dates.dtype == object:
+                dates = np.array([
+                    d.replace(tzinfo=None) if isinstance(d, datetime) else d for d in dates.tolist()
+                ], dtype=object)
+            dates = dates.astype('datetime64[us]')
+        if is_income.size != count or dates.size != count:
+            raise ValueError("transaction_types and transaction_dates must match the number of amounts")
+        if count == 0:
+            return
+
+        start, end = self._size, self._size + count
+        if end > self._amount.size:
+            self._grow(end)
+        self._amount[start:end] = amounts
+        self._date[start:end] = dates
+        self._cat_code[start:end] = codes
+        self._is_income[start:end] = is_income
+        self._month_key[start:end] = self._month_keys(dates)
+        self._descriptions.extend(descriptions)
+        self._size = end
+        self._invalidate_reports()
+
+        expense_totals = np.bincount(codes[~is_income], weights=amounts[~is_income], minlength=len(self._code_to_cat))
+        for code in np.flatnonzero(expense_totals).tolist():
+            self.categories[self._code_to_cat[code]] += float(expense_totals[code])
+        if is_income.any():
+            self.categories['Income'] += float(amounts[is_income].sum())
+
+    def _monthly_aggregates(self, year: int, month: int) -> tuple:
+        # Cached until the next mutation; holds only immutable values and lists that never leave this class
+        key = (year, month)
+        if key in self._report_cache:
+            return self._report_cache[key]
+
+        if 1 <= month <= 12:
+            rows = np.flatnonzero(self._month_key[:self._size] == year * 12 + month)
+        else:  # the key would alias a neighbouring year's month; no date matches
+            rows = np.empty(0, dtype=np.intp)
+        amounts = self._amount[rows]
+        codes = self._cat_code[rows]
+        is_income = self._is_income[rows]
+        totals = np.bincount(codes, weights=amounts, minlength=len(self._code_to_cat))
+        counts = np.bincount(codes, minlength=len(self._code_to_cat))
+        total_expenses, total_income = map(float, np.bincount(is_income, weights=amounts, minlength=2))
+
+        by_category = []
+        present = np.flatnonzero(counts)
+        grouped_rows = np.split(rows[np.argsort(codes, kind='stable')], np.cumsum(counts[present])[:-1])
+        for code, cat_rows in zip(present.tolist(), grouped_rows):
+            by_category.append((
+                self._code_to_cat[code],
+                float(totals[code]),
+                int(counts[code]),
+                self._date[cat_rows].astype('datetime64[D]').astype(str).tolist(),
+                self._amount[cat_rows].tolist(),
+                [self._descriptions[i] for i in cat_rows.tolist()]
+            ))
+
+        aggregates = (total_income, total_expenses, tuple(by_category))
+        self._report_cache[key] = aggregates
+        return aggregates
+
     def get_monthly_report(self, year: int, month: int) -> Dict:
-        monthly_transactions = [
-            t for t in self.transactions
-            if t.date.year == year and t.date.month == month
-        ]
+        total_income, total_expenses, by_category = self._monthly_aggregates(year, month)
 
         report = {
-            'total_income': sum(t.amount for t in monthly_transactions if t.transaction_type == 'income'),
-            'total_expenses': sum(t.amount for t in monthly_transactions if t.transaction_type == 'expense'),
+            'total_income': total_income,
+            'total_expenses': total_expenses,
             'transactions_by_category': {},
             'savings_rate': 0
         }
 
-        for category in self.categories:
-            cat_transactions = [t for t in monthly_transactions if t.category == category]
-            if cat_transactions:
-                report['transactions_by_category'][category] = {
-                    'total': sum(t.amount for t in cat_transactions),
-                    'count': len(cat_transactions),
-                    'budget': self.get_budget(category),
-                    'transactions': [
-                        {
-                            'date': t.date.strftime('%Y-%m-%d'),
-                            'amount': t.amount,
-                            'description': t.description
-                        } for t in cat_transactions
-                    ]
-                }
+        for category, total, count, dates, amounts, descriptions in by_category:
+            report['transactions_by_category'][category] = {
+                'total': total,
+                'count': count,
+                'budget': self.get_budget(category),
+                'transactions': [
+                    {
+                        'date': date_str,
+                        'amount': amount,
+                        'description': description
+                    } for date_str, amount, description in zip(dates, amounts, descriptions)
+                ]
+            }
 
         if report['total_income'] > 0:
             report['savings_rate'] = ((report['total_income'] - report['total_expenses']) / report['total_income']) * 100
@@ -104,29 +286,55 @@ class BudgetManager:
 
     def get_budget_status(self) -> Dict:
         status = {}
-        for category in self.categories:
-            budget = self.get_budget(category)
+        for category, budget in self.monthly_budget.items():
+            if budget <= 0:
+                continue
             spent = self.categories[category]
-            if budget > 0:
-                status[category] = {
-                    'budget': budget,
-                    'spent': spent,
-                    'remaining': budget - spent,
-                    'percentage_used': (spent / budget * 100) if budget > 0 else 0
-                }
+            status[category] = {
+                'budget': budget,
+                'spent': spent,
+                'remaining': budget - spent,
+                'percentage_used': spent / budget * 100
+            }
         return status
 
 class InvestmentAdvisor:
-    def __init__(self):
+    _RISK_MSG = {
+        'low': "Consider low-risk investments like high-yield savings accounts or government bonds.",
+        'medium': "A balanced portfolio of stocks and bonds could be suitable for your risk tolerance.",
+        'high': "You might consider a stock-heavy portfolio or exploring alternative investments."
+    }
+    _MARKET_MSG = {
+        'bull': "The stock market is currently bullish. It might be a good time to invest in equities.",
+        'bear': "The stock market is bearish. Consider defensive stocks or wait for better entry points."
+    }
+    _GOAL_MSG = {
+        'retirement': "For retirement, consider tax-advantaged accounts like 401(k)s or IRAs.",
+        'short_term': "For short-term goals, focus on liquid and low-risk investments."
+    }
+
+    _STOCK_MARKETS = ('bull', 'bear', 'neutral')
+    _ECONOMIC_OUTLOOKS = ('positive', 'negative', 'neutral')
+
+    def __init__(self, seed: Optional[int] = None):
         self.risk_tolerance = None
         self.investment_goals = None
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed)
         self.market_conditions = self.simulate_market_conditions()
 
     def simulate_market_conditions(self):
         return {
-            'stock_market': random.choice(['bull', 'bear', 'neutral']),
-            'interest_rates': random.uniform(0.5, 5.0),
-            'economic_outlook': random.choice(['positive', 'negative', 'neutral'])
+            'stock_market': self._rng.choice(self._STOCK_MARKETS),
+            'interest_rates': self._rng.uniform(0.5, 5.0),
+            'economic_outlook': self._rng.choice(self._ECONOMIC_OUTLOOKS)
+        }
+
+    def simulate_market_scenarios(self, size: int) -> Dict[str, np.ndarray]:
+        return {
+            'stock_market': self._np_rng.choice(self._STOCK_MARKETS, size=size),
+            'interest_rates': self._np_rng.uniform(0.5, 5.0, size=size),
+            'economic_outlook': self._np_rng.choice(self._ECONOMIC_OUTLOOKS, size=size)
         }
 
     def set_user_profile(self, risk_tolerance, investment_goals):
@@ -140,87 +348,172 @@ class InvestmentAdvisor:
         savings_rate = monthly_report['savings_rate']
 
         if self.risk_tolerance is None or self.investment_goals is None:
-            advice.append("Please set your risk tolerance and investment goals for personalized advice.")
+            advice.append(_MSG_PROFILE_MISSING)
             return advice
 
         if savings_rate < 10:
-            advice.append("Focus on increasing your savings rate before making significant investments.")
+            advice.append(_MSG_SAVINGS_FIRST)
             return advice
 
-        if self.risk_tolerance == 'low':
-            advice.append("Consider low-risk investments like high-yield savings accounts or government bonds.")
-        elif self.risk_tolerance == 'medium':
-            advice.append("A balanced portfolio of stocks and bonds could be suitable for your risk tolerance.")
-        elif self.risk_tolerance == 'high':
-            advice.append("You might consider a stock-heavy portfolio or exploring alternative investments.")
+        risk_msg = self._RISK_MSG.get(self.risk_tolerance)
+        if risk_msg is not None:
+            advice.append(risk_msg)
 
-        if self.market_conditions['stock_market'] == 'bull':
-            advice.append("The stock market is currently bullish. It might be a good time to invest in equities.")
-        elif self.market_conditions['stock_market'] == 'bear':
-            advice.append("The stock market is bearish. Consider defensive stocks or wait for better entry points.")
+        market_msg = self._MARKET_MSG.get(self.market_conditions['stock_market'])
+        if market_msg is not None:
+            advice.append(market_msg)
 
         if self.market_conditions['interest_rates'] > 3:
-            advice.append(f"With high interest rates ({self.market_conditions['interest_rates']:.2f}%), consider bonds or high-yield savings accounts.")
+            advice.append(_MSG_HIGH_RATES.format(self.market_conditions['interest_rates']))
 
-        if self.investment_goals == 'retirement':
-            advice.append("For retirement, consider tax-advantaged accounts like 401(k)s or IRAs.")
-        elif self.investment_goals == 'short_term':
-            advice.append("For short-term goals, focus on liquid and low-risk investments.")
+        goal_msg = self._GOAL_MSG.get(self.investment_goals)
+        if goal_msg is not None:
+            advice.append(goal_msg)
 
         return advice
 
+TAX_BRACKETS = {
+    (0, 9950): 0.10,
+    (9951, 40525): 0.12,
+    (40526, 86375): 0.22,
+    (86376, 164925): 0.24,
+    (164926, 209425): 0.32,
+    (209426, 523600): 0.35,
+    (523601, float('inf')): 0.37
+}
+
+def _bracket_arrays(brackets):
+    lo = np.array([lower for lower, _ in brackets], dtype=np.float64)
+    hi = np.array([upper for _, upper in brackets], dtype=np.float64)
+    rate = np.array(list(brackets.values()), dtype=np.float64)
+    return lo, hi, rate
+
+_TAX_LO, _TAX_HI, _TAX_RATE = _bracket_arrays(TAX_BRACKETS)
+
+def _tax_kernel(incomes, lo, hi, rate, deduction):
+    out = np.empty_like(incomes)
+    for i in range(incomes.size):
+        taxable_income = max(incomes[i] - deduction, 0.0)
+        tax = 0.0
+        for j in range(lo.size):
+            if taxable_income > lo[j]:
+                tax += (min(taxable_income, hi[j]) - lo[j]) * rate[j]
+        out[i] = tax
+    return out
+
+if njit is not None:
+    try:
+        # fastmath is left off: it assumes no infinities, and the top bracket is open-ended
+        _jit_tax_kernel = njit(cache=True)(_tax_kernel)
+        _jit_tax_kernel(np.zeros(1), _TAX_LO, _TAX_HI, _TAX_RATE, 0.0)
+    except Exception:  # compiling or loading the numba cache failed; use the numpy path
+        njit = None
+    else:
+        _tax_kernel = _jit_tax_kernel
+
 class TaxAssistant:
+    # (expense key, share of income the expense must exceed, advice)
+    _DEDUCTION_RULES = (
+        ('mortgage_interest', 0.0, "You may be eligible for the mortgage interest deduction."),
+        ('charitable_contributions', 0.0, "Don't forget to claim your charitable contributions as deductions."),
+        ('medical_expenses', 0.075, "You may be eligible to deduct medical expenses exceeding 7.5% of your income."),
+        ('child_care', 0.0, "Look into the Child and Dependent Care Credit."),
+        ('education', 0.0, "You might be eligible for education-related tax credits like the American Opportunity Credit or Lifetime Learning Credit.")
+    )
+
+    RELEVANT_KEYS = tuple(key for key, _, _ in _DEDUCTION_RULES)
+    _LIABILITY_TEMPLATE = "Based on your income of $%.2f, your estimated tax liability is $%.2f."
+    _EFFECTIVE_RATE_TEMPLATE = "Your effective tax rate is approximately %.2f%%."
+
     def __init__(self):
-        self.tax_brackets = {
-            (0, 9950): 0.10,
-            (9951, 40525): 0.12,
-            (40526, 86375): 0.22,
-            (86376, 164925): 0.24,
-            (164926, 209425): 0.32,
-            (209426, 523600): 0.35,
-            (523601, float('inf')): 0.37
-        }
+        self.tax_brackets = dict(TAX_BRACKETS)
         self.standard_deduction = 12550  # for single filers, 2021
 
+    @property
+    def tax_brackets(self) -> Dict:
+        return self._tax_brackets
+
+    @tax_brackets.setter
+    def tax_brackets(self, brackets: Dict) -> None:
+        self._tax_brackets = brackets
+        self._lo, self._hi, self._rate = _bracket_arrays(brackets)
+
     def calculate_tax_liability(self, income: float) -> float:
+        if _tax_c is not None:
+            return _tax_c(income, self.standard_deduction, self._lo, self._hi, self._rate)
+        if njit is not None:
+            incomes = np.array([income], dtype=np.float64)
+            return float(_tax_kernel(incomes, self._lo, self._hi, self._rate, float(self.standard_deduction))[0])
         taxable_income = max(income - self.standard_deduction, 0)
-        tax = 0
-        for (lower, upper), rate in self.tax_brackets.items():
-            if taxable_income > lower:
-                tax += (min(taxable_income, upper) - lower) * rate
-        return tax
+        widths = np.maximum(np.minimum(taxable_income, self._hi) - self._lo, 0)
+        return float(widths @ self._rate)
+
+    def calculate_tax_liability_batch(self, incomes: np.ndarray) -> np.ndarray:
+        incomes = np.ascontiguousarray(incomes, dtype=np.float64)
+        if njit is not None:
+            return _tax_kernel(incomes, self._lo, self._hi, self._rate, float(self.standard_deduction))
+        taxable_income = np.maximum(incomes - self.standard_deduction, 0)
+        widths = np.maximum(np.minimum(taxable_income[:, None], self._hi) - self._lo, 0)
+        return widths @ self._rate
 
     def provide_tax_advice(self, income: float, expenses: Dict[str, float]) -> List[str]:
-        advice = []
         tax_liability = self.calculate_tax_liability(income)
+        effective_rate = (tax_liability / income) * 100
+        advice = [
+            self._LIABILITY_TEMPLATE % (income, tax_liability),
+            self._EFFECTIVE_RATE_TEMPLATE % effective_rate
+        ]
 
-        advice.append(f"Based on your income of ${income:.2f}, your estimated tax liability is ${tax_liability:.2f}.")
-        advice.append(f"Your effective tax rate is approximately {(tax_liability / income) * 100:.2f}%.")
-
-        if expenses.get('mortgage_interest', 0) > 0:
-            advice.append("You may be eligible for the mortgage interest deduction.")
-        if expenses.get('charitable_contributions', 0) > 0:
-            advice.append("Don't forget to claim your charitable contributions as deductions.")
-        if expenses.get('medical_expenses', 0) > 0.075 * income:
-            advice.append("You may be eligible to deduct medical expenses exceeding 7.5% of your income.")
-
-        if expenses.get('child_care', 0) > 0:
-            advice.append("Look into the Child and Dependent Care Credit.")
-        if expenses.get('education', 0) > 0:
-            advice.append("You might be eligible for education-related tax credits like the American Opportunity Credit or Lifetime Learning Credit.")
+        get_expense = expenses.get
+        for key, income_share, message in self._DEDUCTION_RULES:
+            if get_expense(key, 0.0) > income_share * income:
+                advice.append(message)
 
-        advice.append("Keep all receipts and documentation for your deductions and credits.")
-        advice.append("The deadline for filing your tax return is April 15th. Mark your calendar!")
+        advice.extend(_MSG_TAX_CLOSING)
 
         return advice
 
+SAVINGS_RATE_TARGET = 20  # percent of income
+HOUSING_INCOME_LIMIT = 0.3  # share of income
+
+# Source for FinancialAIAgent(specialize=True): the thresholds, messages and
+# tax keys are baked in as constants when the agent is constructed.
+_RECOMMEND_SOURCE = """
+def recommend(monthly_report):
+    recommendations = []
+    income = monthly_report['total_income']
+    by_category = monthly_report['transactions_by_category']
+    if monthly_report['savings_rate'] < {savings_rate_target!r}:
+        recommendations.append({savings_msg!r})
+    housing = by_category.get('Housing')
+    if housing is not None and housing['total'] > income * {housing_limit!r}:
+        recommendations.append({housing_msg!r})
+    recommendations.extend(agent.investment_advisor.provide_investment_advice(monthly_report))
+    expense_dict = {{key: by_category[key]['total'] for key in {relevant_keys!r} if key in by_category}}
+    recommendations.extend(agent.tax_assistant.provide_tax_advice(income, expense_dict))
+    return recommendations
+"""
+
 class FinancialAIAgent:
-    def __init__(self):
+    def __init__(self, specialize: bool = False):
         self.budget_manager = BudgetManager()
         self.investment_advisor = InvestmentAdvisor()
         self.tax_assistant = TaxAssistant()
+        self._fast_recommend = self._specialize_recommendations() if specialize else None
         self._create_data_directory()
 
+    def _specialize_recommendations(self):
+        source = _RECOMMEND_SOURCE.format(
+            savings_rate_target=SAVINGS_RATE_TARGET,
+            savings_msg=_MSG_SAVINGS_LOW,
+            housing_limit=HOUSING_INCOME_LIMIT,
+            housing_msg=_MSG_HOUSING_HIGH,
+            relevant_keys=self.tax_assistant.RELEVANT_KEYS
+        )
+        namespace = {'agent': self}
+        exec(source, namespace)
+        return namespace['recommend']
+
     def _create_data_directory(self):
         Path("financial_data").mkdir(exist_ok=True)
 
@@ -229,19 +522,20 @@ class FinancialAIAgent:
             data = {
                 'categories': self.budget_manager.categories,
                 'monthly_budget': self.budget_manager.monthly_budget,
-                'transactions': [
-                    {
-                        'date': t.date.isoformat(),
-                        'amount': t.amount,
-                        'category': t.category,
-                        'description': t.description,
-                        'transaction_type': t.transaction_type
-                    }
-                    for t in self.budget_manager.transactions
-                ]
+                'transactions': self.budget_manager.transaction_columns()
             }
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(data, indent=2).encode()
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filename) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                    f.write(payload)
+                os.replace(tmp_path, filename)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             print(f"Data successfully saved to {filename}")
         except Exception as e:
             print(f"Error saving data: {str(e)}")
@@ -267,23 +561,27 @@ class FinancialAIAgent:
         return report
 
     def _generate_recommendations(self, monthly_report: Dict) -> List[str]:
+        if self._fast_recommend is not None:
+            return self._fast_recommend(monthly_report)
+
         recommendations = []
         income = monthly_report['total_income']
         expenses = monthly_report['total_expenses']
         savings_rate = monthly_report['savings_rate']
 
-        if savings_rate < 20:
-            recommendations.append("Consider increasing your savings rate to at least 20% of income")
+        if savings_rate < SAVINGS_RATE_TARGET:
+            recommendations.append(_MSG_SAVINGS_LOW)
 
         if 'Housing' in monthly_report['transactions_by_category']:
             housing_cost = monthly_report['transactions_by_category']['Housing']['total']
-            if housing_cost > income * 0.3:
-                recommendations.append("Housing costs exceed 30% of income - consider ways to reduce housing expenses")
+            if housing_cost > income * HOUSING_INCOME_LIMIT:
+                recommendations.append(_MSG_HOUSING_HIGH)
 
         investment_advice = self.investment_advisor.provide_investment_advice(monthly_report)
         recommendations.extend(investment_advice)
 
-        expense_dict = {category: data['total'] for category, data in monthly_report['transactions_by_category'].items()}
+        by_category = monthly_report['transactions_by_category']
+        expense_dict = {key: by_category[key]['total'] for key in self.tax_assistant.RELEVANT_KEYS if key in by_category}
         tax_advice = self.tax_assistant.provide_tax_advice(income, expense_dict)
         recommendations.extend(tax_advice)
 
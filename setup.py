@@ -0,0 +1,8 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Builds the optional tax_kernel extension: python setup.py build_ext --inplace
+setup(
+    name="financial-ai-agent",
+    ext_modules=cythonize("tax_kernel.pyx"),
+)
@@ -0,0 +1,17 @@
+# cython: language_level=3
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef double tax(double income, double deduction, const double[::1] lo,
+                 const double[::1] hi, const double[::1] rate) noexcept nogil:
+    cdef double taxable_income = income - deduction
+    cdef double total = 0.0
+    cdef Py_ssize_t j
+    if taxable_income < 0:
+        taxable_income = 0
+    for j in range(lo.shape[0]):
+        if taxable_income > lo[j]:
+            total += (min(taxable_income, hi[j]) - lo[j]) * rate[j]
+    return total